@@ -31,6 +31,15 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     async def handle_delete_item(call: ServiceCall) -> None:
         await store.async_delete_item(call.data["id"])
 
+    async def handle_add_items(call: ServiceCall) -> None:
+        await store.async_add_items(call.data["items"])
+
+    async def handle_update_items(call: ServiceCall) -> None:
+        await store.async_update_items(call.data["items"])
+
+    async def handle_delete_items(call: ServiceCall) -> None:
+        await store.async_delete_items(call.data["ids"])
+
     async def handle_move_item_area(call: ServiceCall) -> None:
         await store.async_move_item_area(
             call.data["id"], call.data.get("area_id")
@@ -65,6 +74,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.services.async_register(DOMAIN, "add_item", handle_add_item)
     hass.services.async_register(DOMAIN, "update_item", handle_update_item)
     hass.services.async_register(DOMAIN, "delete_item", handle_delete_item)
+    hass.services.async_register(DOMAIN, "add_items", handle_add_items)
+    hass.services.async_register(DOMAIN, "update_items", handle_update_items)
+    hass.services.async_register(DOMAIN, "delete_items", handle_delete_items)
     hass.services.async_register(DOMAIN, "move_item_area", handle_move_item_area)
     hass.services.async_register(DOMAIN, "set_item_zone", handle_set_item_zone)
 
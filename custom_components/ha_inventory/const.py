@@ -1,4 +1,6 @@
 DOMAIN = "ha_inventory"
 
 STORAGE_KEY = "ha_inventory.v1"
-STORAGE_VERSION = 1
\ No newline at end of file
+STORAGE_VERSION = 1
+ITEMS_STORAGE_KEY = f"{STORAGE_KEY}_items"
+CATEGORIES_STORAGE_KEY = f"{STORAGE_KEY}_cats"
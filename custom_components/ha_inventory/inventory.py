@@ -1,23 +1,176 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import itertools
+import logging
+from collections import defaultdict
 import os
-import mimetypes
-import uuid
-from dataclasses import dataclass, field, asdict
+import re
+import secrets
+import shutil
+import time
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, TypedDict, Union
+from typing import Any, DefaultDict, Dict, List, Optional, TypedDict, Union
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.storage import Store
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CoreState, Event, HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+from homeassistant.util.json import json_loads
 
-from .const import STORAGE_KEY, STORAGE_VERSION
+from .const import (
+    CATEGORIES_STORAGE_KEY,
+    ITEMS_STORAGE_KEY,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# The mutation log is folded back into the snapshot once it grows past
+# either limit.
+_LOG_MAX_ENTRIES = 1000
+_LOG_MAX_BYTES = 1024 * 1024
+
+
+# Timestamps requested within the same millisecond share one string.
+_iso_cache: tuple[float, str] = (0.0, "")
 
 
 def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    global _iso_cache
+    now = time.time()
+    if 0 <= now - _iso_cache[0] < 0.001:
+        return _iso_cache[1]
+    value = datetime.fromtimestamp(now, timezone.utc).isoformat()
+    _iso_cache = (now, value)
+    return value
+
+
+_EXT_BY_MIME = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+    "image/heic": ".heic",
+}
+
+# Ids sort by creation time: millisecond timestamp, a per-process random
+# prefix and a counter, without an os.urandom call per id.
+_id_prefix = secrets.token_hex(4)
+_id_counter = itertools.count()
+
+
+def _new_id() -> str:
+    return f"{int(time.time() * 1000):012x}-{_id_prefix}-{next(_id_counter):06x}"
+
+
+# The extension ends up in an on-disk name and a /local URL, so only plain
+# alphanumeric extensions from user-supplied filenames are trusted.
+_SAFE_EXT_RE = re.compile(r"\.[A-Za-z0-9]{1,8}")
+
+
+def _photo_ext(suggested_filename: Optional[str], mime_type: str) -> str:
+    ext = _EXT_BY_MIME.get(mime_type.split(";", 1)[0].strip().lower(), ".jpg")
+
+    if suggested_filename and "." in suggested_filename:
+        suggested_ext = os.path.splitext(suggested_filename)[1]
+        if _SAFE_EXT_RE.fullmatch(suggested_ext):
+            ext = suggested_ext
+    return ext
+
 
+_FN_TRANS = str.maketrans({"/": "_", "\\": "_", "\x00": "_", ":": "_"})
 
-@dataclass
+
+def _sanitize_filename(filename: str) -> str:
+    return filename.translate(_FN_TRANS)
+
+
+def _write_bytes(path: str, content: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _place_photo(tmp_path: str, path: str) -> None:
+    """Move a finished temp file to its content-addressed path."""
+    if os.path.exists(path):
+        os.remove(tmp_path)
+    else:
+        os.replace(tmp_path, path)
+
+
+def _store_photo_bytes(photo_dir: str, content: bytes, ext: str) -> str:
+    """Write content under its SHA-256 name unless it is already stored."""
+    digest = hashlib.sha256(content).hexdigest()
+    path = os.path.join(photo_dir, f"{digest}{ext}")
+    if not os.path.exists(path):
+        tmp_path = f"{path}.{_new_id()}.part"
+        try:
+            _write_bytes(tmp_path, content)
+            _place_photo(tmp_path, path)
+        except BaseException:
+            # The photo directory is served under /local; leave no partials.
+            _remove_file(tmp_path)
+            raise
+    return digest
+
+
+def _store_photo_file(photo_dir: str, src_path: str, ext: str) -> str:
+    """Copy src_path under its SHA-256 name unless it is already stored."""
+    with open(src_path, "rb") as f:
+        digest = hashlib.file_digest(f, "sha256").hexdigest()
+    path = os.path.join(photo_dir, f"{digest}{ext}")
+    if not os.path.exists(path):
+        tmp_path = f"{path}.{_new_id()}.part"
+        try:
+            # copyfile uses sendfile/fcopyfile where available, so the data
+            # never passes through Python buffers.
+            shutil.copyfile(src_path, tmp_path)
+            _place_photo(tmp_path, path)
+        except BaseException:
+            _remove_file(tmp_path)
+            raise
+    return digest
+
+
+def _append_bytes(path: str, content: bytes) -> None:
+    with open(path, "ab") as f:
+        f.write(content)
+
+
+def _read_log(path: str) -> tuple[List[Dict[str, Any]], int, bool]:
+    """Return the decodable entries, the log size and whether it ends torn."""
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return [], 0, False
+
+    entries: List[Dict[str, Any]] = []
+    for line in raw.splitlines():
+        try:
+            entries.append(json_loads(line))
+        except ValueError:
+            # Torn write from an unclean shutdown; the snapshot written
+            # after replay drops it.
+            continue
+    return entries, len(raw), bool(raw) and not raw.endswith(b"\n")
+
+
+@dataclass(slots=True, frozen=True)
 class Attachment:
     id: str
     category: str
@@ -25,9 +178,10 @@ class Attachment:
     content_type: str
     path: str
     uploaded_at: str
+    sha256: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     id: str
     name: str
@@ -64,8 +218,64 @@ class Item:
     created_at: str = field(default_factory=_now_iso)
     updated_at: str = field(default_factory=_now_iso)
 
+    # Serialized form reused by async_save; reset whenever the item mutates.
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "area_id": self.area_id,
+            "zone_entity_id": self.zone_entity_id,
+            "ha_label_ids": list(self.ha_label_ids),
+            "category_id": self.category_id,
+            "quantity": self.quantity,
+            "unit": self.unit,
+            "purchase_date": self.purchase_date,
+            "purchase_price": self.purchase_price,
+            "purchase_currency": self.purchase_currency,
+            "warranty_expires_at": self.warranty_expires_at,
+            "serial_number": self.serial_number,
+            "model_number": self.model_number,
+            "asset_tag": self.asset_tag,
+            "condition": self.condition,
+            "archived": self.archived,
+            "parent_item_id": self.parent_item_id,
+            "custom_fields": dict(self.custom_fields),
+            # Attachments are frozen and the storage helper encodes
+            # dataclasses natively with orjson, so no dict copy.
+            "attachments": list(self.attachments),
+            "notes": self.notes,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
 
-@dataclass
+
+# Item fields with a reverse index (value -> item ids) kept by the store.
+_INDEXED_FIELDS = ("area_id", "zone_entity_id", "category_id", "parent_item_id")
+
+
+def _check_indexed(values: Dict[str, Any]) -> None:
+    """Reject indexed field values that cannot be index keys.
+
+    Service data has no schema, so this runs before an item is touched to
+    avoid leaving it half-updated and out of the indexes.
+    """
+    for name in _INDEXED_FIELDS:
+        value = values.get(name)
+        if value is not None and not isinstance(value, str):
+            raise ValueError(f"{name} must be a string or null")
+
+# Fields that update_item may set; private and identity fields are excluded.
+_ITEM_UPDATABLE = frozenset(
+    f.name for f in fields(Item) if not f.name.startswith("_")
+) - {"id", "attachments", "created_at"}
+
+
+@dataclass(slots=True)
 class Category:
     id: str
     name: str
@@ -74,10 +284,33 @@ class Category:
     created_at: str = field(default_factory=_now_iso)
     updated_at: str = field(default_factory=_now_iso)
 
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "parent_id": self.parent_id,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
 
 class _StoredData(TypedDict, total=False):
     items: List[Dict[str, Any]]
     categories: List[Dict[str, Any]]
+    # Sequence number of the last log entry already folded into the items.
+    log_seq: int
+
+
+def _item_from_dict(raw_item: Dict[str, Any]) -> Item:
+    item_data = dict(raw_item)
+    attachments = [Attachment(**a) for a in item_data.get("attachments", [])]
+    item_data["attachments"] = attachments
+    return Item(**item_data)
 
 
 class InventoryStore:
@@ -85,100 +318,381 @@ class InventoryStore:
 
     def __init__(self, hass: HomeAssistant) -> None:
         self._hass = hass
-        self._store: Store[_StoredData] = Store(
+        # Items and categories are persisted separately so that a change to
+        # one does not reserialize the other.
+        self._items_store: Store[_StoredData] = Store(
             hass,
             STORAGE_VERSION,
-            STORAGE_KEY,
+            ITEMS_STORAGE_KEY,
+        )
+        self._cats_store: Store[_StoredData] = Store(
+            hass,
+            STORAGE_VERSION,
+            CATEGORIES_STORAGE_KEY,
         )
         self.items: Dict[str, Item] = {}
         self.categories: Dict[str, Category] = {}
+        self._indexes: Dict[str, DefaultDict[Optional[str], set[str]]] = {
+            name: defaultdict(set) for name in _INDEXED_FIELDS
+        }
+
+        # Mutations only mark the store dirty; the actual write is deferred
+        # so that a burst of service calls collapses into a single save.
+        # Changed items are appended to a mutation log and only periodically
+        # compacted into a full snapshot.
+        self._dirty_items = False
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._save_delay = 0.5
+        self._save_lock = asyncio.Lock()
+        self._changed_item_ids: set[str] = set()
+        self._log_path = hass.config.path(STORAGE_DIR, f"{STORAGE_KEY}.log")
+        self._log_entries = 0
+        self._log_size = 0
+        self._log_seq = 0
+        # Set when the log ends in a partial line, so the next append
+        # starts on a fresh line instead of being glued onto it.
+        self._log_torn = False
+
+        self._photo_dir: Optional[str] = None
 
     async def async_load(self) -> None:
-        data = await self._store.async_load() or {}
-        for raw_item in data.get("items", []):
-            item_data = dict(raw_item)
-            attachments = [Attachment(**a) for a in item_data.get("attachments", [])]
-            item_data["attachments"] = attachments
-            item = Item(**item_data)
+        items_data, cats_data = await asyncio.gather(
+            self._items_store.async_load(), self._cats_store.async_load()
+        )
+
+        # Older versions kept items and categories in a single file. It is
+        # only removed once both new stores are written, so any store still
+        # missing is filled from it (this also resumes an interrupted
+        # migration).
+        legacy_store: Optional[Store[_StoredData]] = None
+        if items_data is None or cats_data is None:
+            legacy_store = Store(self._hass, STORAGE_VERSION, STORAGE_KEY)
+            legacy_data = await legacy_store.async_load()
+            if legacy_data is None:
+                legacy_store = None
+            else:
+                if items_data is None:
+                    items_data = legacy_data
+                if cats_data is None:
+                    cats_data = legacy_data
+
+        for raw_item in (items_data or {}).get("items", []):
+            item = _item_from_dict(raw_item)
             self.items[item.id] = item
 
-        for raw_cat in data.get("categories", []):
+        for raw_cat in (cats_data or {}).get("categories", []):
             cat = Category(**raw_cat)
             self.categories[cat.id] = cat
 
-    async def async_save(self) -> None:
-        data: _StoredData = {
-            "items": [],
-            "categories": [],
-        }
+        # A crash between writing a snapshot and removing the log leaves
+        # entries the snapshot already covers; skip those by sequence number.
+        base_seq = (items_data or {}).get("log_seq", -1)
+        self._log_seq = max(base_seq, 0)
+
+        entries, log_size, self._log_torn = await self._hass.async_add_executor_job(
+            _read_log, self._log_path
+        )
+        for entry in entries:
+            seq = entry.get("seq", 0)
+            if seq <= base_seq:
+                continue
+            self._log_seq = max(self._log_seq, seq)
+            if entry.get("op") == "upsert":
+                item = _item_from_dict(entry["item"])
+                self.items[item.id] = item
+            elif entry.get("op") == "delete":
+                self.items.pop(entry["id"], None)
+        self._log_entries = len(entries)
+        self._log_size = log_size
+        if legacy_store is not None:
+            try:
+                await self.async_save()
+            except HomeAssistantError as err:
+                _LOGGER.warning("Keeping legacy inventory storage: %s", err)
+            else:
+                await legacy_store.async_remove()
+        elif log_size:
+            try:
+                async with self._save_lock:
+                    await self._async_write_items()
+            except HomeAssistantError as err:
+                _LOGGER.warning("Keeping inventory mutation log: %s", err)
 
         for item in self.items.values():
-            item_dict = asdict(item)
-            item_dict["attachments"] = [asdict(a) for a in item.attachments]
+            self._index_item(item)
+
+        await self._hass.async_add_executor_job(self._ensure_photo_dir)
+
+        self._hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_handle_stop
+        )
+
+    async def async_save(self) -> None:
+        """Write full snapshots of both stores and truncate the mutation log."""
+        async with self._save_lock:
+            self._dirty_items = False
+            await asyncio.gather(
+                self._async_write_items(), self._async_write_categories()
+            )
+
+    async def _async_write_items(self) -> None:
+        # Each snapshot takes its own seq so it can be recognised on disk.
+        self._log_seq += 1
+        log_seq = self._log_seq
+        data: _StoredData = {"log_seq": log_seq, "items": []}
+        for item in self.items.values():
+            item_dict = item._cached_dict or item.to_dict()
+            item._cached_dict = item_dict
             data["items"].append(item_dict)
 
-        for cat in self.categories.values():
-            data["categories"].append(asdict(cat))
+        # The snapshot covers everything changed so far.
+        covered = self._changed_item_ids
+        self._changed_item_ids = set()
 
-        await self._store.async_save(data)
+        try:
+            await self._items_store.async_save(data)
+            if not await self._async_snapshot_landed(log_seq):
+                raise HomeAssistantError("Inventory snapshot was not written")
+        except Exception:
+            self._schedule_save(*covered)
+            raise
+        await self._hass.async_add_executor_job(_remove_file, self._log_path)
+        self._log_entries = 0
+        self._log_size = 0
+        self._log_torn = False
+
+    async def _async_snapshot_landed(self, log_seq: int) -> bool:
+        """Check the items file on disk holds the snapshot with log_seq.
+
+        Store.async_save logs and swallows write errors, and defers the
+        write while Home Assistant is stopping, so a fresh Store is used to
+        read back what actually reached disk before the log is dropped.
+        """
+        stored = await Store(
+            self._hass, STORAGE_VERSION, ITEMS_STORAGE_KEY
+        ).async_load()
+        return stored is not None and stored.get("log_seq") == log_seq
+
+    async def _async_write_categories(self) -> None:
+        data: _StoredData = {"categories": []}
+        for cat in self.categories.values():
+            cat_dict = cat._cached_dict or cat.to_dict()
+            cat._cached_dict = cat_dict
+            data["categories"].append(cat_dict)
+
+        await self._cats_store.async_save(data)
+
+    async def _async_append_log(self, item_ids: set[str]) -> None:
+        lines = []
+        for item_id in item_ids:
+            self._log_seq += 1
+            item = self.items.get(item_id)
+            if item is None:
+                entry = {"op": "delete", "seq": self._log_seq, "id": item_id}
+            else:
+                item_dict = item._cached_dict or item.to_dict()
+                item._cached_dict = item_dict
+                entry = {
+                    "op": "upsert",
+                    "seq": self._log_seq,
+                    "id": item_id,
+                    "item": item_dict,
+                }
+            lines.append(json_bytes(entry))
+
+        payload = b"\n".join(lines) + b"\n"
+        if self._log_torn:
+            payload = b"\n" + payload
+        await self._hass.async_add_executor_job(
+            _append_bytes, self._log_path, payload
+        )
+        self._log_torn = False
+        self._log_entries += len(lines)
+        self._log_size += len(payload)
+
+    def _schedule_save(self, *item_ids: str) -> None:
+        """Record changed items and arm the deferred save if needed."""
+        self._dirty_items = True
+        self._changed_item_ids.update(item_ids)
+        # Later mutations join the pending save rather than pushing it back,
+        # so a steady stream of calls cannot postpone the write forever.
+        if self._save_handle is None:
+            self._save_handle = self._hass.loop.call_later(
+                self._save_delay,
+                lambda: self._hass.async_create_task(self._flush_save()),
+            )
+
+    async def _flush_save(self) -> None:
+        self._save_handle = None
+        async with self._save_lock:
+            if not self._dirty_items:
+                return
+            self._dirty_items = False
+            changed = self._changed_item_ids
+            self._changed_item_ids = set()
+            await self._async_flush_items(changed)
+
+    async def _async_flush_items(self, changed: set[str]) -> None:
+        # Store defers writes while Home Assistant is stopping, so only the
+        # log is appended then.
+        compact = self._hass.state is not CoreState.stopping and (
+            self._log_entries + len(changed) > _LOG_MAX_ENTRIES
+            or self._log_size > _LOG_MAX_BYTES
+        )
+        try:
+            if compact:
+                await self._async_write_items()
+            elif changed:
+                await self._async_append_log(changed)
+        except Exception:
+            # Keep the changes pending and retry on the next save window.
+            self._schedule_save(*changed)
+            raise
+
+    async def _async_handle_stop(self, event: Event) -> None:
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+        await self._flush_save()
 
     #
     # Item CRUD
     #
 
-    async def async_add_item(self, **data: Any) -> Item:
-        item_id = data.get("id") or str(uuid.uuid4())
+    def _get_item(self, item_id: str) -> Optional[Item]:
+        """Look up an item by id for the CRUD and photo service methods."""
+        return self.items.get(item_id)
+
+    def items_by(self, field_name: str, value: Optional[str]) -> List[Item]:
+        """Return items whose indexed field equals value, without a scan."""
+        return [self.items[i] for i in self._indexes[field_name].get(value, ())]
+
+    def _index_item(self, item: Item) -> None:
+        for name, index in self._indexes.items():
+            index[getattr(item, name)].add(item.id)
+
+    def _unindex_item(self, item: Item) -> None:
+        for name, index in self._indexes.items():
+            value = getattr(item, name)
+            ids = index.get(value)
+            if ids is None:
+                continue
+            ids.discard(item.id)
+            if not ids:
+                del index[value]
+
+    def _build_item(self, data: Dict[str, Any]) -> Item:
+        item_id = data.get("id") or _new_id()
         data["id"] = item_id
         if "name" not in data:
             raise ValueError("Item name is required")
 
         if "attachments" in data:
             data.pop("attachments")
+        _check_indexed(data)
+
+        return Item(**data)
 
-        item = Item(**data)
+    def _insert_item(self, item: Item) -> None:
+        previous = self.items.get(item.id)
+        if previous is not None:
+            self._unindex_item(previous)
         self.items[item.id] = item
-        await self.async_save()
+        self._index_item(item)
+
+    def _update_item(self, item: Item, changes: Dict[str, Any], now: str) -> None:
+        _check_indexed(changes)
+        self._unindex_item(item)
+        for key, value in changes.items():
+            if key in _ITEM_UPDATABLE:
+                setattr(item, key, value)
+        self._index_item(item)
+
+        item.updated_at = now
+        item._cached_dict = None
+
+    def _delete_item(self, item_id: str) -> bool:
+        item = self.items.pop(item_id, None)
+        if item is None:
+            return False
+        self._unindex_item(item)
+        return True
+
+    async def async_add_item(self, **data: Any) -> Item:
+        item = self._build_item(data)
+        self._insert_item(item)
+        self._schedule_save(item.id)
         return item
 
     async def async_update_item(self, item_id: str, **changes: Any) -> Optional[Item]:
-        item = self.items.get(item_id)
+        item = self._get_item(item_id)
         if not item:
             return None
 
-        for key, value in changes.items():
-            if not hasattr(item, key):
-                continue
-            if key == "attachments":
-                continue
-            setattr(item, key, value)
-
-        item.updated_at = _now_iso()
-        await self.async_save()
+        self._update_item(item, changes, _now_iso())
+        self._schedule_save(item.id)
         return item
 
     async def async_delete_item(self, item_id: str) -> bool:
-        if item_id not in self.items:
+        if not self._delete_item(item_id):
             return False
-        self.items.pop(item_id)
-        await self.async_save()
+        self._schedule_save(item_id)
         return True
 
+    async def async_add_items(self, items: List[Dict[str, Any]]) -> List[Item]:
+        # Build every item before inserting any, so an invalid entry
+        # rejects the whole batch.
+        added = [self._build_item(dict(data)) for data in items]
+        for item in added:
+            self._insert_item(item)
+        self._schedule_save(*(item.id for item in added))
+        return added
+
+    async def async_update_items(self, items: List[Dict[str, Any]]) -> List[Item]:
+        now = _now_iso()
+        updated: List[Item] = []
+        try:
+            for data in items:
+                changes = dict(data)
+                item = self._get_item(changes.pop("id", None))
+                if not item:
+                    continue
+                self._update_item(item, changes, now)
+                updated.append(item)
+        finally:
+            # Entries applied before a rejected one still need persisting.
+            self._schedule_save(*(item.id for item in updated))
+        return updated
+
+    async def async_delete_items(self, item_ids: List[str]) -> int:
+        deleted = [item_id for item_id in item_ids if self._delete_item(item_id)]
+        self._schedule_save(*deleted)
+        return len(deleted)
+
     async def async_move_item_area(self, item_id: str, area_id: Optional[str]) -> Optional[Item]:
-        item = self.items.get(item_id)
+        item = self._get_item(item_id)
         if not item:
             return None
+        _check_indexed({"area_id": area_id})
+        self._unindex_item(item)
         item.area_id = area_id
+        self._index_item(item)
         item.updated_at = _now_iso()
-        await self.async_save()
+        item._cached_dict = None
+        self._schedule_save(item.id)
         return item
 
     async def async_set_item_zone(self, item_id: str, zone_entity_id: Optional[str]) -> Optional[Item]:
-        item = self.items.get(item_id)
+        item = self._get_item(item_id)
         if not item:
             return None
+        _check_indexed({"zone_entity_id": zone_entity_id})
+        self._unindex_item(item)
         item.zone_entity_id = zone_entity_id
+        self._index_item(item)
         item.updated_at = _now_iso()
-        await self.async_save()
+        item._cached_dict = None
+        self._schedule_save(item.id)
         return item
 
     #
@@ -186,10 +700,43 @@ class InventoryStore:
     #
 
     def _ensure_photo_dir(self) -> str:
+        if self._photo_dir is not None:
+            return self._photo_dir
         photo_dir = self._hass.config.path("www/ha_inventory")
         os.makedirs(photo_dir, exist_ok=True)
+        self._photo_dir = photo_dir
         return photo_dir
 
+    async def _async_photo_dir(self) -> str:
+        return self._photo_dir or await self._hass.async_add_executor_job(
+            self._ensure_photo_dir
+        )
+
+    def _finalize_attachment(
+        self,
+        item: Item,
+        filename: str,
+        mime_type: str,
+        *,
+        name: Optional[str] = None,
+        sha256: Optional[str] = None,
+    ) -> Item:
+        attachment = Attachment(
+            id=_new_id(),
+            category="photo",
+            name=_sanitize_filename(name) if name else filename,
+            content_type=mime_type,
+            path=f"/local/ha_inventory/{filename}",
+            uploaded_at=_now_iso(),
+            sha256=sha256,
+        )
+
+        item.attachments.append(attachment)
+        item.updated_at = _now_iso()
+        item._cached_dict = None
+        self._schedule_save(item.id)
+        return item
+
     async def async_add_item_photo_from_bytes(
         self,
         item_id: str,
@@ -198,40 +745,29 @@ class InventoryStore:
         suggested_filename: Optional[str] = None,
         mime_type: Optional[str] = None,
     ) -> Optional[Item]:
-        item = self.items.get(item_id)
+        item = self._get_item(item_id)
         if not item:
             return None
 
-        photo_dir = self._ensure_photo_dir()
+        photo_dir = await self._async_photo_dir()
 
         if not mime_type:
             mime_type = "image/jpeg"
+        ext = _photo_ext(suggested_filename, mime_type)
 
-        ext = mimetypes.guess_extension(mime_type.split(";", 1)[0]) or ".jpg"
-
-        if suggested_filename and "." in suggested_filename:
-            ext = os.path.splitext(suggested_filename)[1] or ext
-
-        filename = suggested_filename or f"{item_id}-{uuid.uuid4().hex}{ext}"
-        filename = filename.replace("/", "_").replace("\\", "_")
-
-        file_path = os.path.join(photo_dir, filename)
-        with open(file_path, "wb") as f:
-            f.write(content)
-
-        attachment = Attachment(
-            id=str(uuid.uuid4()),
-            category="photo",
-            name=filename,
-            content_type=mime_type,
-            path=f"/local/ha_inventory/{filename}",
-            uploaded_at=_now_iso(),
+        # Photos are stored under their content hash, so re-uploads of the
+        # same image only add an attachment entry.
+        digest = await self._hass.async_add_executor_job(
+            _store_photo_bytes, photo_dir, content, ext
         )
 
-        item.attachments.append(attachment)
-        item.updated_at = _now_iso()
-        await self.async_save()
-        return item
+        return self._finalize_attachment(
+            item,
+            f"{digest}{ext}",
+            mime_type,
+            name=suggested_filename,
+            sha256=digest,
+        )
 
     async def async_add_item_photo_from_url(
         self,
@@ -242,22 +778,42 @@ class InventoryStore:
     ) -> Optional[Item]:
         from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-        item = self.items.get(item_id)
+        item = self._get_item(item_id)
         if not item:
             return None
 
+        photo_dir = await self._async_photo_dir()
+
         session = async_get_clientsession(self._hass)
         async with session.get(image_url) as resp:
             if resp.status != 200:
                 return None
-            content = await resp.read()
             mime_type = resp.headers.get("Content-Type", "image/jpeg")
+            ext = _photo_ext(suggested_filename, mime_type)
+            tmp_path = os.path.join(photo_dir, f"{_new_id()}.part")
+
+            # Stream the body straight to disk instead of buffering it,
+            # hashing as we go to find its content-addressed name.
+            hasher = hashlib.sha256()
+            f = await self._hass.async_add_executor_job(open, tmp_path, "wb")
+            try:
+                async for chunk in resp.content.iter_chunked(_DOWNLOAD_CHUNK_SIZE):
+                    hasher.update(chunk)
+                    await self._hass.async_add_executor_job(f.write, chunk)
+            except BaseException:
+                await self._hass.async_add_executor_job(f.close)
+                await self._hass.async_add_executor_job(_remove_file, tmp_path)
+                raise
+            await self._hass.async_add_executor_job(f.close)
+
+        digest = hasher.hexdigest()
+        filename = f"{digest}{ext}"
+        await self._hass.async_add_executor_job(
+            _place_photo, tmp_path, os.path.join(photo_dir, filename)
+        )
 
-        return await self.async_add_item_photo_from_bytes(
-            item_id=item_id,
-            content=content,
-            suggested_filename=suggested_filename,
-            mime_type=mime_type,
+        return self._finalize_attachment(
+            item, filename, mime_type, name=suggested_filename, sha256=digest
         )
 
     async def async_add_item_photo_from_file_info(
@@ -266,7 +822,7 @@ class InventoryStore:
         file_info: Union[Dict[str, Any], Any],
     ) -> Optional[Item]:
 
-        item = self.items.get(item_id)
+        item = self._get_item(item_id)
         if not item:
             return None
 
@@ -282,15 +838,19 @@ class InventoryStore:
         if not src_path:
             return None
 
+        photo_dir = await self._async_photo_dir()
+
+        if not mime_type:
+            mime_type = "image/jpeg"
+        ext = _photo_ext(filename, mime_type)
+
         try:
-            with open(src_path, "rb") as f:
-                content = f.read()
+            digest = await self._hass.async_add_executor_job(
+                _store_photo_file, photo_dir, src_path, ext
+            )
         except OSError:
             return None
 
-        return await self.async_add_item_photo_from_bytes(
-            item_id=item_id,
-            content=content,
-            suggested_filename=filename,
-            mime_type=mime_type,
+        return self._finalize_attachment(
+            item, f"{digest}{ext}", mime_type, name=filename, sha256=digest
         )
\ No newline at end of file